@@ -4,18 +4,38 @@ News Notify App - FastAPI Web API
 Webhook と Website の管理API
 """
 
+import gzip
+import hashlib
+import os
+from contextlib import asynccontextmanager
+from typing import NamedTuple
+import anyio.to_thread
+import msgspec
+import orjson
 import uvicorn
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from app import db, Webhook, Website, ArticleDatabase
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from app import db, Webhook, Website, ArticleDatabase, VersionedCache
+
+# DBアクセスは同期処理のため、ハンドラはスレッドプールで実行される
+THREAD_POOL_SIZE = 100
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動時にスレッドプールの上限を引き上げる"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_POOL_SIZE
+    yield
 
 # FastAPIアプリケーション
 app = FastAPI(
     title="News Notify App API",
     description="ニュース通知アプリケーションの管理API",
     version="0.1.0",
-    root_path="/api/v1"
+    root_path="/api/v1",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # レスポンス用モデル
@@ -74,317 +94,384 @@ class StatusResponse(BaseModel):
     message: str
     success: bool
 
-# ヘルスチェック
-@app.get("/")
+# リクエストボディの検証（生のJSONバイト列をTypeAdapterで直接検証する）
+WEBHOOK_CREATE_ADAPTER = TypeAdapter(WebhookCreate)
+WEBHOOK_UPDATE_ADAPTER = TypeAdapter(WebhookUpdate)
+WEBSITE_CREATE_ADAPTER = TypeAdapter(WebsiteCreate)
+WEBSITE_UPDATE_ADAPTER = TypeAdapter(WebsiteUpdate)
+
+def json_body(adapter: TypeAdapter):
+    """リクエストボディを検証する依存関係を作成"""
+    async def parse(request: Request):
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+    return parse
+
+def request_body_schema(model: type[BaseModel]) -> dict:
+    """OpenAPIにリクエストボディのスキーマを登録するための定義を作成"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
+# シリアライズ用の構造体（レスポンス生成はmsgspecで行い、リクエスト検証はPydanticのまま）
+class WebhookRecord(msgspec.Struct):
+    id: int
+    name: str
+    endpoint: str
+    service_type: str
+    is_active: bool
+    created_at: str
+
+class WebsiteRecord(msgspec.Struct):
+    id: int
+    name: str
+    type: str
+    url: str
+    avatar: str | None
+    selector: str | None
+    is_active: bool
+    needs_translation: bool
+    target_webhook_ids: str | None
+    created_at: str
+
+_json_encoder = msgspec.json.Encoder()
+
+def _to_webhook_record(webhook: Webhook) -> WebhookRecord:
+    """WebhookをWebhookRecordに変換"""
+    return WebhookRecord(
+        id=webhook.id,
+        name=webhook.name,
+        endpoint=webhook.endpoint,
+        service_type=webhook.service_type,
+        is_active=webhook.is_active,
+        created_at=webhook.created_at or ""
+    )
+
+def _to_website_record(website: Website) -> WebsiteRecord:
+    """WebsiteをWebsiteRecordに変換"""
+    return WebsiteRecord(
+        id=website.id,
+        name=website.name,
+        type=website.type,
+        url=website.url,
+        avatar=website.avatar,
+        selector=website.selector,
+        is_active=website.is_active,
+        needs_translation=website.needs_translation,
+        target_webhook_ids=website.target_webhook_ids,
+        created_at=website.created_at or ""
+    )
+
+def _json_response(content: msgspec.Struct | list[msgspec.Struct]) -> Response:
+    """構造体をJSONエンコードしてレスポンスを作成"""
+    return Response(content=_json_encoder.encode(content), media_type="application/json")
+
+# レスポンスのキャッシュ（キー: エンドポイント名）
+# ワーカープロセスごとに保持するため、他プロセスの更新はPRAGMA data_versionで検知する
+CACHE_TTL_SECONDS = 10
+GZIP_MINIMUM_SIZE = 512
+GZIP_COMPRESS_LEVEL = 5
+
+class CachedPayload(NamedTuple):
+    payload: bytes
+    gzipped: bytes | None  # 小さいレスポンスは圧縮しない
+    etag: str
+
+_response_cache = VersionedCache(CACHE_TTL_SECONDS, lambda: db.get_data_version())
+
+def _build_webhooks_payload() -> bytes:
+    """Webhook一覧のJSONバイト列を作成
+
+    DBの行（列順は get_active_webhooks_raw を参照）から位置引数で構造体を作り、1回でエンコードする
+    """
+    return _json_encoder.encode([
+        WebhookRecord(row[0], row[1], row[2], row[3], bool(row[4]), row[5] or "")
+        for row in db.get_active_webhooks_raw()
+    ])
+
+def _build_websites_payload() -> bytes:
+    """Website一覧のJSONバイト列を作成
+
+    DBの行（列順は get_active_websites_raw を参照）から位置引数で構造体を作り、1回でエンコードする
+    """
+    return _json_encoder.encode([
+        WebsiteRecord(
+            row[0], row[1], row[2], row[3], row[4], row[5],
+            bool(row[6]), bool(row[7]), row[8], row[9] or ""
+        )
+        for row in db.get_active_websites_raw()
+    ])
+
+def _build_stats_payload() -> bytes:
+    """統計情報のJSONバイト列を作成"""
+    total_articles, webhook_count, website_count = db.get_dashboard_counts()
+    return _json_encoder.encode({
+        "total_articles": total_articles,
+        "active_webhooks": webhook_count,
+        "active_websites": website_count
+    })
+
+_CACHE_BUILDERS = {
+    "webhooks": _build_webhooks_payload,
+    "websites": _build_websites_payload,
+    "stats": _build_stats_payload,
+}
+
+def _build_cached_payload(key: str) -> CachedPayload:
+    """JSONバイト列を作成し、圧縮とETagの計算も済ませておく"""
+    payload = _CACHE_BUILDERS[key]()
+    gzipped = (
+        gzip.compress(payload, compresslevel=GZIP_COMPRESS_LEVEL)
+        if len(payload) >= GZIP_MINIMUM_SIZE
+        else None
+    )
+    # gzip有無で同じ値を使うため弱いETagとする
+    etag = f'W/"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    return CachedPayload(payload, gzipped, etag)
+
+def _get_cached(key: str) -> CachedPayload:
+    """キャッシュからJSONバイト列を取得（期限切れの場合は再作成する）"""
+    return _response_cache.get(key, lambda: _build_cached_payload(key))
+
+def _invalidate_cache(key: str) -> None:
+    """キャッシュを破棄（統計情報も件数が変わるため合わせて破棄）"""
+    _response_cache.invalidate(key, "stats")
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """If-None-Matchヘッダーが現在のETagと一致するか判定"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque_tag for tag in if_none_match.split(","))
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    """Accept-Encodingヘッダーでgzipが許可されているか判定（q=0は拒否として扱う）"""
+    if not accept_encoding:
+        return False
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    # gzipの指定が無ければ「*」の指定に従う
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
+
+def cached_response(key: str, request: Request) -> Response:
+    """キャッシュ経由でJSONレスポンスを返す
+
+    内容が変わっていなければ304を返し、gzip対応クライアントには圧縮済みバイト列を返す
+    """
+    entry = _get_cached(key)
+    headers = {"ETag": entry.etag, "Vary": "Accept-Encoding"}
+
+    if _etag_matches(entry.etag, request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if entry.gzipped is not None and _accepts_gzip(request.headers.get("accept-encoding")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=entry.gzipped, media_type="application/json", headers=headers)
+    return Response(content=entry.payload, media_type="application/json", headers=headers)
+
+# ヘルスチェック（固定レスポンスのため起動時にエンコードしておく）
+_ROOT_PAYLOAD = orjson.dumps({"message": "News Notify App API", "status": "running"})
+_HEALTH_PAYLOAD = orjson.dumps({"status": "healthy", "database": "connected"})
+
+@app.get("/", include_in_schema=False)
 async def root():
-    return {"message": "News Notify App API", "status": "running"}
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
-@app.get("/health")
+@app.get("/health", include_in_schema=False)
 async def health_check():
-    return {"status": "healthy", "database": "connected"}
+    return Response(content=_HEALTH_PAYLOAD, media_type="application/json")
+
+# 想定外のエラーは共通ハンドラで500に変換
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": f"サーバーエラー: {exc}"}
+    )
 
 # Webhook API
-@app.get("/webhooks", response_model=list[WebhookResponse])
-async def get_webhooks():
+@app.get("/webhooks", responses={200: {"model": list[WebhookResponse]}})
+def get_webhooks(request: Request):
     """全てのWebhookを取得"""
-    try:
-        webhooks = db.get_active_webhooks()
-        return [
-            WebhookResponse(
-                id=webhook.id,
-                name=webhook.name,
-                endpoint=webhook.endpoint,
-                service_type=webhook.service_type,
-                is_active=webhook.is_active,
-                created_at=webhook.created_at or ""
-            )
-            for webhook in webhooks
-        ]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Webhook取得エラー: {str(e)}"
-        )
+    return cached_response("webhooks", request)
 
-@app.get("/webhooks/{webhook_id}", response_model=WebhookResponse)
-async def get_webhook(webhook_id: int):
+@app.get("/webhooks/{webhook_id}", responses={200: {"model": WebhookResponse}})
+def get_webhook(webhook_id: int):
     """指定されたWebhookを取得"""
-    try:
-        webhooks = db.get_active_webhooks()
-        webhook = next((w for w in webhooks if w.id == webhook_id), None)
-
-        if not webhook:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Webhookが見つかりません"
-            )
-
-        return WebhookResponse(
-            id=webhook.id,
-            name=webhook.name,
-            endpoint=webhook.endpoint,
-            service_type=webhook.service_type,
-            is_active=webhook.is_active,
-            created_at=webhook.created_at or ""
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    webhook = db.get_webhook_by_id(webhook_id)
+    if not webhook:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Webhook取得エラー: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Webhookが見つかりません"
         )
 
-@app.post("/webhooks", response_model=StatusResponse)
-async def create_webhook(webhook_data: WebhookCreate):
+    return _json_response(_to_webhook_record(webhook))
+
+@app.post("/webhooks", response_model=StatusResponse, openapi_extra=request_body_schema(WebhookCreate))
+def create_webhook(webhook_data: WebhookCreate = Depends(json_body(WEBHOOK_CREATE_ADAPTER))):
     """新しいWebhookを作成"""
-    try:
-        webhook = Webhook(
-            name=webhook_data.name,
-            endpoint=webhook_data.endpoint,
-            service_type=webhook_data.service_type,
-            is_active=webhook_data.is_active
+    if not db.add_webhook_raw(
+        webhook_data.name,
+        webhook_data.endpoint,
+        webhook_data.service_type,
+        webhook_data.is_active
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Webhook作成に失敗しました（名前が重複している可能性があります）"
         )
 
-        if db.add_webhook(webhook):
-            return StatusResponse(message="Webhook作成成功", success=True)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Webhook作成に失敗しました（名前が重複している可能性があります）"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
+    _invalidate_cache("webhooks")
+    return StatusResponse(message="Webhook作成成功", success=True)
+
+@app.put("/webhooks/{webhook_id}", response_model=StatusResponse, openapi_extra=request_body_schema(WebhookUpdate))
+def update_webhook(webhook_id: int, webhook_data: WebhookUpdate = Depends(json_body(WEBHOOK_UPDATE_ADAPTER))):
+    """Webhookを更新"""
+    # 現在のWebhookを取得（再有効化できるよう非アクティブも対象）
+    if not db.get_webhook_by_id(webhook_id, include_inactive=True):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Webhook作成エラー: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Webhookが見つかりません"
         )
 
-@app.put("/webhooks/{webhook_id}", response_model=StatusResponse)
-async def update_webhook(webhook_id: int, webhook_data: WebhookUpdate):
-    """Webhookを更新"""
-    try:
-        # 現在のWebhookを取得
-        webhooks = db.get_active_webhooks()
-        current_webhook = next((w for w in webhooks if w.id == webhook_id), None)
-
-        if not current_webhook:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Webhookが見つかりません"
-            )
+    # is_activeの更新のみサポート（他のフィールドは削除して再作成が必要）
+    if webhook_data.is_active is None:
+        return StatusResponse(message="更新項目がありません", success=True)
 
-        # is_activeの更新のみサポート（他のフィールドは削除して再作成が必要）
-        if webhook_data.is_active is not None:
-            if db.update_webhook_status(webhook_id, webhook_data.is_active):
-                return StatusResponse(message="Webhook更新成功", success=True)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Webhook更新に失敗しました"
-                )
-        else:
-            return StatusResponse(message="更新項目がありません", success=True)
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not db.update_webhook_status(webhook_id, webhook_data.is_active):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Webhook更新エラー: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Webhook更新に失敗しました"
         )
 
+    _invalidate_cache("webhooks")
+    return StatusResponse(message="Webhook更新成功", success=True)
+
 @app.delete("/webhooks/{webhook_id}", response_model=StatusResponse)
-async def delete_webhook(webhook_id: int):
+def delete_webhook(webhook_id: int):
     """Webhookを削除"""
-    try:
-        if db.delete_webhook(webhook_id):
-            return StatusResponse(message="Webhook削除成功", success=True)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Webhookが見つかりません"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not db.delete_webhook(webhook_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Webhook削除エラー: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Webhookが見つかりません"
         )
 
+    _invalidate_cache("webhooks")
+    return StatusResponse(message="Webhook削除成功", success=True)
+
 # Website API
-@app.get("/websites", response_model=list[WebsiteResponse])
-async def get_websites():
+@app.get("/websites", responses={200: {"model": list[WebsiteResponse]}})
+def get_websites(request: Request):
     """全てのWebsiteを取得"""
-    try:
-        websites = db.get_active_websites()
-        return [
-            WebsiteResponse(
-                id=website.id,
-                name=website.name,
-                type=website.type,
-                url=website.url,
-                avatar=website.avatar,
-                selector=website.selector,
-                is_active=website.is_active,
-                needs_translation=website.needs_translation,
-                target_webhook_ids=website.target_webhook_ids,
-                created_at=website.created_at or ""
-            )
-            for website in websites
-        ]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Website取得エラー: {str(e)}"
-        )
+    return cached_response("websites", request)
 
-@app.get("/websites/{website_id}", response_model=WebsiteResponse)
-async def get_website(website_id: int):
+@app.get("/websites/{website_id}", responses={200: {"model": WebsiteResponse}})
+def get_website(website_id: int):
     """指定されたWebsiteを取得"""
-    try:
-        websites = db.get_active_websites()
-        website = next((w for w in websites if w.id == website_id), None)
-
-        if not website:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Websiteが見つかりません"
-            )
-
-        return WebsiteResponse(
-            id=website.id,
-            name=website.name,
-            type=website.type,
-            url=website.url,
-            avatar=website.avatar,
-            selector=website.selector,
-            is_active=website.is_active,
-            needs_translation=website.needs_translation,
-            target_webhook_ids=website.target_webhook_ids,
-            created_at=website.created_at or ""
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    website = db.get_website_by_id(website_id)
+    if not website:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Website取得エラー: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Websiteが見つかりません"
         )
 
-@app.post("/websites", response_model=StatusResponse)
-async def create_website(website_data: WebsiteCreate):
+    return _json_response(_to_website_record(website))
+
+@app.post("/websites", response_model=StatusResponse, openapi_extra=request_body_schema(WebsiteCreate))
+def create_website(website_data: WebsiteCreate = Depends(json_body(WEBSITE_CREATE_ADAPTER))):
     """新しいWebsiteを作成"""
-    try:
-        website = Website(
-            name=website_data.name,
-            type=website_data.type,
-            url=website_data.url,
-            avatar=website_data.avatar,
-            selector=website_data.selector,
-            is_active=website_data.is_active,
-            needs_translation=website_data.needs_translation,
-            target_webhook_ids=website_data.target_webhook_ids
+    if not db.add_website_raw(
+        website_data.name,
+        website_data.type,
+        website_data.url,
+        website_data.avatar,
+        website_data.selector,
+        website_data.is_active,
+        website_data.needs_translation,
+        website_data.target_webhook_ids
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Website作成に失敗しました（名前が重複している可能性があります）"
         )
 
-        if db.add_website(website):
-            return StatusResponse(message="Website作成成功", success=True)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Website作成に失敗しました（名前が重複している可能性があります）"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
+    _invalidate_cache("websites")
+    return StatusResponse(message="Website作成成功", success=True)
+
+@app.put("/websites/{website_id}", response_model=StatusResponse, openapi_extra=request_body_schema(WebsiteUpdate))
+def update_website(website_id: int, website_data: WebsiteUpdate = Depends(json_body(WEBSITE_UPDATE_ADAPTER))):
+    """Websiteを更新"""
+    # 現在のWebsiteを取得（再有効化できるよう非アクティブも対象）
+    if not db.get_website_by_id(website_id, include_inactive=True):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Website作成エラー: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Websiteが見つかりません"
         )
 
-@app.put("/websites/{website_id}", response_model=StatusResponse)
-async def update_website(website_id: int, website_data: WebsiteUpdate):
-    """Websiteを更新"""
-    try:
-        # 現在のWebsiteを取得
-        websites = db.get_active_websites()
-        current_website = next((w for w in websites if w.id == website_id), None)
-
-        if not current_website:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Websiteが見つかりません"
-            )
+    # is_activeの更新のみサポート（他のフィールドは削除して再作成が必要）
+    if website_data.is_active is None:
+        return StatusResponse(message="更新項目がありません", success=True)
 
-        # is_activeの更新のみサポート（他のフィールドは削除して再作成が必要）
-        if website_data.is_active is not None:
-            if db.update_website_status(website_id, website_data.is_active):
-                return StatusResponse(message="Website更新成功", success=True)
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Website更新に失敗しました"
-                )
-        else:
-            return StatusResponse(message="更新項目がありません", success=True)
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not db.update_website_status(website_id, website_data.is_active):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Website更新エラー: {str(e)}"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Website更新に失敗しました"
         )
 
+    _invalidate_cache("websites")
+    return StatusResponse(message="Website更新成功", success=True)
+
 @app.delete("/websites/{website_id}", response_model=StatusResponse)
-async def delete_website(website_id: int):
+def delete_website(website_id: int):
     """Websiteを削除"""
-    try:
-        if db.delete_website(website_id):
-            return StatusResponse(message="Website削除成功", success=True)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Websiteが見つかりません"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not db.delete_website(website_id):
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Website削除エラー: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Websiteが見つかりません"
         )
 
+    _invalidate_cache("websites")
+    return StatusResponse(message="Website削除成功", success=True)
+
 # 統計情報API
 @app.get("/stats")
-async def get_stats():
+def get_stats(request: Request):
     """統計情報を取得"""
-    try:
-        total_articles = db.get_article_count()
-        webhook_count = len(db.get_active_webhooks())
-        website_count = len(db.get_active_websites())
-
-        return {
-            "total_articles": total_articles,
-            "active_webhooks": webhook_count,
-            "active_websites": website_count
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"統計情報取得エラー: {str(e)}"
-        )
+    return cached_response("stats", request)
 
 def run_api():
-    """APIサーバーを起動"""
+    """APIサーバーを起動（環境変数 DEV=1 で自動リロードを有効化）"""
+    reload = os.getenv("DEV") == "1"
     uvicorn.run(
         "api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
-        log_level="info"
+        reload=reload,
+        workers=None if reload else int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))),
+        log_level="warning",
+        access_log=reload
     )
 
 if __name__ == "__main__":
@@ -1,22 +1,51 @@
-import time
+import asyncio
+import codecs
 import logging
-import requests
-import feedparser
+import aiohttp
 import threading
+import time
 import sqlite3
 import hashlib
+import orjson
+import random
+import re
+import signal
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from typing import Any
+from urllib.parse import urljoin
 from abc import ABC, abstractmethod
-from pydantic import BaseModel
-from bs4 import BeautifulSoup
-from apscheduler.schedulers.blocking import BlockingScheduler
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 # 定数
 REQUEST_TIMEOUT = 30
+HTTP_CONNECT_TIMEOUT = 3  # 接続確立までのタイムアウト（秒）
+HTTP_READ_TIMEOUT = 10  # 受信が途切れてから打ち切るまでのタイムアウト（秒）
+HTTP_POOL_LIMIT = 64  # HTTPコネクションプール全体の上限
+HTTP_POOL_LIMIT_PER_HOST = 16  # 同一ホストへの同時接続数の上限
+HTTP_KEEPALIVE_TIMEOUT = 30  # アイドル接続を保持する秒数
+HTTP_DNS_CACHE_TTL = 300  # DNS解決結果のキャッシュ秒数
 MAX_ARTICLES_PER_SITE = 10
+MAX_CONCURRENT_SITES = 32  # 同時に処理するサイト数の上限
 DATABASE_PATH = "news_notify_app.db"
+ACTIVE_CACHE_TTL_SECONDS = 60  # アクティブなWebhook/Websiteのキャッシュ保持時間
+SQLITE_IN_CHUNK_SIZE = 500  # IN句のプレースホルダ上限（SQLiteの999制限未満）
 TRANSLATION_API_URL = "https://api.mymemory.translated.net/get"
+NOTIFY_MAX_RETRIES = 3  # Webhook送信の最大試行回数
+NOTIFY_RETRY_BASE_DELAY = 0.5  # 再試行待ち時間の初期値（秒）
+NOTIFY_RETRY_MAX_DELAY = 5.0  # 再試行待ち時間の上限（秒）
+TRANSLATION_CACHE_SIZE = 4096  # メモリ上に保持する翻訳結果の件数
+TRANSLATION_MAX_QUERY_LENGTH = 500  # MyMemory APIの1リクエストあたりの上限
+TRANSLATION_BATCH_DELIMITER = "\n---\n"  # 一括翻訳時の区切り
+TRANSLATION_SPLIT_PATTERN = re.compile(r"\s*-{3}\s*")
+# ひらがな・カタカナ・漢字のいずれかを含むかの判定用
+JAPANESE_CHAR_PATTERN = re.compile("[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9faf]")
+SCHEDULE_TIMEZONE = timezone(timedelta(hours=9))  # 日本時間（UTC+9）
+SCHEDULE_HOUR = 9  # 毎日の実行時刻（時）
+SCHEDULE_MINUTE = 0  # 毎日の実行時刻（分）
 
 # ログ設定
 logging.basicConfig(
@@ -24,60 +53,185 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 翻訳結果のLRUキャッシュ（原文 → 訳文）
+_translation_cache: OrderedDict[str, str] = OrderedDict()
 
-def translate_to_japanese(text: str) -> str:
-    """テキストを日本語に翻訳"""
+
+def _remember_translation(text: str, translated: str) -> None:
+    """翻訳結果をLRUキャッシュに登録"""
+    _translation_cache[text] = translated
+    _translation_cache.move_to_end(text)
+    if len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+        _translation_cache.popitem(last=False)
+
+
+def _needs_translation(text: str) -> bool:
+    """翻訳APIに問い合わせる必要があるか判定"""
     if not text or not text.strip():
-        return text
+        return False
 
-    # 既に日本語が含まれている場合はそのまま返す
-    if any(
-        "\u3040" <= char <= "\u309f"
-        or "\u30a0" <= char <= "\u30ff"
-        or "\u4e00" <= char <= "\u9faf"
-        for char in text
-    ):
+    # 既に日本語が含まれている場合は翻訳しない
+    if JAPANESE_CHAR_PATTERN.search(text):
         logger.debug(f"日本語が含まれているため翻訳をスキップ: {text[:50]}...")
-        return text
+        return False
+    return True
+
+
+async def _lookup_translations(texts: list[str]) -> dict[str, str]:
+    """過去の翻訳結果をメモリ → DBの順に検索（見つかったものだけ返す）"""
+    found: dict[str, str] = {}
+    missing: list[str] = []
+    for text in texts:
+        cached = _translation_cache.get(text)
+        if cached is not None:
+            _translation_cache.move_to_end(text)
+            found[text] = cached
+        else:
+            missing.append(text)
+
+    if missing:
+        # DBはイベントループを止めないようスレッドで1回だけ問い合わせる
+        stored = await asyncio.to_thread(db.get_translations, missing)
+        for text, translated in stored.items():
+            _remember_translation(text, translated)
+        found.update(stored)
+    return found
+
 
+async def _store_translations(translations: list[tuple[str, str]]) -> None:
+    """翻訳結果（原文, 訳文）をメモリとDBに保存"""
+    for text, translated in translations:
+        _remember_translation(text, translated)
+    await asyncio.to_thread(db.save_translations, translations)
+
+
+async def _request_translation(
+    session: aiohttp.ClientSession, query: str
+) -> str | None:
+    """MyMemory APIで翻訳（失敗時はNone）"""
     try:
         params = {
-            "q": text,
+            "q": query,
             "langpair": "en|ja",
             "de": "your-email@example.com",  # MyMemory APIでは任意のメールアドレスを指定
         }
 
-        response = requests.get(
-            TRANSLATION_API_URL, params=params, timeout=REQUEST_TIMEOUT
-        )
-        response.raise_for_status()
-
-        data = response.json()
+        async with session.get(TRANSLATION_API_URL, params=params) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None)
 
         if data.get("responseStatus") == 200:
-            translated_text = data.get("responseData", {}).get("translatedText", text)
-            logger.info(f"翻訳成功: {text[:30]}... → {translated_text[:30]}...")
-            return translated_text
+            return data.get("responseData", {}).get("translatedText", query)
         else:
             logger.warning(
                 f"翻訳API応答エラー: {data.get('responseDetails', 'Unknown error')}"
             )
-            return text
+            return None
 
-    except requests.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         logger.error(f"翻訳APIリクエストエラー: {e}")
-        return text
+        return None
     except Exception as e:
         logger.error(f"翻訳処理エラー: {e}")
+        return None
+
+
+async def translate_to_japanese(session: aiohttp.ClientSession, text: str) -> str:
+    """テキストを日本語に翻訳"""
+    if not _needs_translation(text):
         return text
 
+    # 同じタイトルは過去の翻訳結果を再利用
+    query = text.strip()
+    found = (await _lookup_translations([query])).get(query)
+    if found is not None:
+        return found
 
-class Article(BaseModel):
+    translated_text = await _request_translation(session, query)
+    if translated_text is None:
+        return text
+    logger.info(f"翻訳成功: {text[:30]}... → {translated_text[:30]}...")
+    await _store_translations([(query, translated_text)])
+    return translated_text
+
+
+async def _translate_chunk(
+    session: aiohttp.ClientSession, queries: list[str]
+) -> list[str]:
+    """区切り文字で連結した1リクエストで翻訳し、分割できなければ個別に翻訳"""
+    if len(queries) > 1:
+        joined = await _request_translation(
+            session, TRANSLATION_BATCH_DELIMITER.join(queries)
+        )
+        if joined is not None:
+            parts = [part.strip() for part in TRANSLATION_SPLIT_PATTERN.split(joined)]
+            if len(parts) == len(queries):
+                logger.info(f"一括翻訳成功: {len(queries)}件")
+                await _store_translations(list(zip(queries, parts)))
+                return parts
+        logger.warning(f"一括翻訳を分割できないため個別に翻訳します: {len(queries)}件")
+    return list(
+        await asyncio.gather(
+            *(translate_to_japanese(session, query) for query in queries)
+        )
+    )
+
+
+async def translate_batch(
+    session: aiohttp.ClientSession, texts: list[str]
+) -> list[str]:
+    """複数のテキストをまとめて日本語に翻訳（入力と同じ順序で返す）"""
+    results = list(texts)
+    positions: dict[str, list[int]] = {}  # 翻訳が必要な原文 → textsの位置
+    for index, text in enumerate(texts):
+        if _needs_translation(text):
+            positions.setdefault(text.strip(), []).append(index)
+
+    # 過去の翻訳結果はまとめて検索
+    found = await _lookup_translations(list(positions))
+    pending: dict[str, list[int]] = {}  # 未翻訳の原文 → textsの位置
+    for query, indexes in positions.items():
+        translated = found.get(query)
+        if translated is None:
+            pending[query] = indexes
+            continue
+        for index in indexes:
+            results[index] = translated
+
+    if not pending:
+        return results
+
+    # APIのクエリ長上限に収まるようにまとめる
+    chunks: list[list[str]] = []
+    chunk_length = 0
+    for query in pending:
+        added_length = len(query) + len(TRANSLATION_BATCH_DELIMITER)
+        if chunks and chunk_length + added_length <= TRANSLATION_MAX_QUERY_LENGTH:
+            chunks[-1].append(query)
+            chunk_length += added_length
+        else:
+            chunks.append([query])
+            chunk_length = len(query)
+
+    translated_chunks = await asyncio.gather(
+        *(_translate_chunk(session, chunk) for chunk in chunks)
+    )
+    for chunk, translations in zip(chunks, translated_chunks):
+        for query, translated in zip(chunk, translations):
+            for index in pending[query]:
+                results[index] = translated
+    return results
+
+
+@dataclass(slots=True, frozen=True)
+class Article:
     """記事を表すデータクラス"""
 
     title: str
     url: str
     original_title: str | None = None  # 翻訳前のオリジナルタイトル
+    # get_hash()の計算結果
+    _hash: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_embed_dict(self) -> dict[str, str]:
         """Discord埋め込み用の辞書に変換"""
@@ -86,22 +240,34 @@ class Article(BaseModel):
     def get_hash(self) -> str:
         """記事のハッシュ値を生成（重複チェック用）"""
         # ハッシュ値はオリジナルタイトルで生成（翻訳による重複を防ぐ）
-        original_title = self.original_title or self.title
-        content = f"{original_title}|{self.url}"
-        return hashlib.md5(content.encode("utf-8")).hexdigest()
+        if self._hash is None:
+            original_title = self.original_title or self.title
+            content = f"{original_title}|{self.url}"
+            # frozenのため属性の設定はobject.__setattr__で行う
+            object.__setattr__(
+                self, "_hash", hashlib.md5(content.encode("utf-8")).hexdigest()
+            )
+        return self._hash
 
-    def translate_title(self) -> "Article":
+    async def translate_title(self, session: aiohttp.ClientSession) -> "Article":
         """タイトルを日本語に翻訳した新しいArticleインスタンスを返す"""
         if not self.original_title:
             # 初回翻訳の場合、現在のタイトルをオリジナルとして保存
-            translated_title = translate_to_japanese(self.title)
-            return Article(
-                title=translated_title, url=self.url, original_title=self.title
-            )
+            translated_title = await translate_to_japanese(session, self.title)
+            return self.with_translated_title(translated_title)
         else:
             # 既に翻訳済みの場合はそのまま返す
             return self
 
+    def with_translated_title(self, translated_title: str) -> "Article":
+        """翻訳済みタイトルを持つ新しいArticleインスタンスを返す"""
+        translated = Article(
+            title=translated_title, url=self.url, original_title=self.title
+        )
+        # オリジナルタイトルとURLは同じなのでハッシュも引き継げる
+        object.__setattr__(translated, "_hash", self._hash)
+        return translated
+
 
 class Webhook(BaseModel):
     """Webhookを表すデータクラス"""
@@ -114,6 +280,12 @@ class Webhook(BaseModel):
     created_at: str | None = None
 
 
+def _retry_delay(attempt: int) -> float:
+    """再試行までの待ち時間（指数バックオフ + フルジッター）"""
+    backoff = NOTIFY_RETRY_BASE_DELAY * 2 ** (attempt - 1)
+    return random.uniform(0, min(NOTIFY_RETRY_MAX_DELAY, backoff))
+
+
 class NotificationService(ABC):
     """通知サービスの基底クラス"""
 
@@ -132,7 +304,12 @@ class NotificationService(ABC):
         """サービス固有のヘッダーを取得"""
         pass
 
-    def send_notification(self, website: "Website", articles: list[Article]) -> bool:
+    async def send_notification(
+        self,
+        session: aiohttp.ClientSession,
+        website: "Website",
+        articles: list[Article],
+    ) -> bool:
         """通知を送信"""
         if not articles:
             logger.info(
@@ -140,31 +317,29 @@ class NotificationService(ABC):
             )
             return True
 
-        payload = self.create_payload(website, articles)
+        # 再試行でも同じ本文を使うため、JSONへの変換は1回だけ行う
+        body = orjson.dumps(self.create_payload(website, articles))
         headers = self.get_headers()
-        max_retries = 3
+        max_retries = NOTIFY_MAX_RETRIES
 
         for attempt in range(1, max_retries + 1):
             try:
-                response = requests.post(
-                    self.webhook.endpoint,
-                    json=payload,
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT,
-                )
-                response.raise_for_status()
+                async with session.post(
+                    self.webhook.endpoint, data=body, headers=headers
+                ) as response:
+                    response.raise_for_status()
 
                 logger.info(
                     f"{self.webhook.service_type}投稿成功: {website.name} -> {self.webhook.name} ({len(articles)}件)"
                 )
                 return True
 
-            except requests.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.error(
                     f"{self.webhook.service_type}投稿エラー [{website.name} -> {self.webhook.name}] (試行 {attempt}/{max_retries}): {e}"
                 )
                 if attempt < max_retries:
-                    time.sleep(1)
+                    await asyncio.sleep(_retry_delay(attempt))
                 else:
                     return False
             except Exception as e:
@@ -283,6 +458,9 @@ class TeamsService(NotificationService):
 class Website(BaseModel):
     """ウェブサイトの基底クラス"""
 
+    # 解析済みのtarget_webhook_idsをキャッシュするため生成後の変更は禁止
+    model_config = ConfigDict(frozen=True)
+
     id: int | None = None
     name: str
     type: str
@@ -293,21 +471,96 @@ class Website(BaseModel):
     needs_translation: bool = False  # 翻訳が必要かのフラグ,
     target_webhook_ids: str | None = None
     created_at: str | None = None
+    # target_webhook_idsを解析したIDの集合
+    _target_webhook_id_set: frozenset[int] | None = PrivateAttr(default=None)
+    # 今回のレスポンスの(ETag, Last-Modified)
+    _http_validators: tuple[str | None, str | None] | None = PrivateAttr(default=None)
+
+    def get_target_webhook_ids(self) -> frozenset[int] | None:
+        """配信先WebhookのIDを集合で取得（未設定の場合はNone）"""
+        if not self.target_webhook_ids:
+            return None
+        if self._target_webhook_id_set is None:
+            self._target_webhook_id_set = frozenset(
+                int(value)
+                for value in (v.strip() for v in self.target_webhook_ids.split(","))
+                if value.isdecimal()
+            )
+        return self._target_webhook_id_set
 
-    def fetch_articles(self) -> list[Article]:
+    async def _conditional_get_headers(self) -> dict[str, str]:
+        """前回保存したETag/Last-Modifiedから条件付きGET用のヘッダーを作成"""
+        etag, last_modified = await asyncio.to_thread(
+            db.get_http_validators, self.url
+        )
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _remember_http_validators(self, response: aiohttp.ClientResponse) -> None:
+        """レスポンスのETag/Last-Modifiedを保持（保存は処理成功後）"""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._http_validators = (etag, last_modified)
+
+    def save_http_validators(self) -> None:
+        """保持しているETag/Last-ModifiedをDBに保存"""
+        if self._http_validators is not None:
+            db.save_http_validators(self.url, *self._http_validators)
+
+    async def fetch_articles(self, session: aiohttp.ClientSession) -> list[Article]:
         """記事を取得する抽象メソッド"""
         raise NotImplementedError("Subclasses must implement fetch_articles()")
 
-    def _validate_url(self, url: str) -> str:
-        """URLの検証と正規化"""
-        if not url.startswith(("http://", "https://")):
-            if self.url.endswith("/") and not url.startswith("/"):
-                return f"{self.url}{url}"
-            elif not self.url.endswith("/") and url.startswith("/"):
-                return f"{self.url}{url}"
-            else:
-                return f"{self.url}/{url}"
-        return url
+
+class VersionedCache:
+    """TTLとPRAGMA data_versionで鮮度を判定するキー単位のキャッシュ
+
+    無効化のたびにキーごとの世代を進め、値の作成中に無効化された場合は保存しない。
+    同じ接続での書き込みはdata_versionを変えないため、書き込み前に作成した古い値が
+    無効化の後に保存されてTTLの間残るのを防ぐ。
+    """
+
+    def __init__(self, ttl: float, get_data_version: Callable[[], int | None]):
+        self._ttl = ttl
+        self._get_data_version = get_data_version
+        # キー → (有効期限, data_version, 値)
+        self._entries: dict[str, tuple[float, int | None, Any]] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, builder: Callable[[], Any]) -> Any:
+        """有効なキャッシュがあれば返し、なければbuilderで作成して保存"""
+        now = time.monotonic()
+        data_version = self._get_data_version()
+        with self._lock:
+            entry = self._entries.get(key)
+            generation = self._generations.get(key, 0)
+        if (
+            entry
+            and data_version is not None
+            and entry[0] > now
+            and entry[1] == data_version
+        ):
+            return entry[2]
+
+        value = builder()
+        with self._lock:
+            # 作成中に無効化されていなければ保存
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = (now + self._ttl, data_version, value)
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        """キャッシュを破棄し、作成中の値も保存されないよう世代を進める"""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
 
 
 class ArticleDatabase:
@@ -315,12 +568,38 @@ class ArticleDatabase:
 
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
+        # 接続は使い回し、スレッド間の排他はロックで行う
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._lock = threading.RLock()
+        # アクティブなWebhook/Websiteのキャッシュ
+        self._active_cache = VersionedCache(
+            ACTIVE_CACHE_TTL_SECONDS, self.get_data_version
+        )
         self._init_database()
 
+    @contextmanager
+    def session(self) -> Iterator[sqlite3.Connection]:
+        """共有コネクションを取得（正常終了時にコミット、例外時にロールバック）"""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def _get_cached_active(
+        self, key: str, loader: Callable[[], list[Any]]
+    ) -> list[Any]:
+        """TTL内かつ他プロセスからの更新がなければキャッシュした一覧を返す"""
+        return list(self._active_cache.get(key, loader))
+
+    def _invalidate_active(self, key: str) -> None:
+        """キャッシュした一覧を破棄"""
+        self._active_cache.invalidate(key)
+
     def _init_database(self) -> None:
         """データベースとテーブルを初期化"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
 
                 # 記事テーブル
@@ -369,12 +648,33 @@ class ArticleDatabase:
                 """
                 )
 
-                # インデックス作成
+                # 翻訳キャッシュテーブル
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS translations (
+                        text_hash TEXT PRIMARY KEY,
+                        translated TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """
+                )
+
+                # 条件付きGET用のETag/Last-Modifiedテーブル
                 cursor.execute(
                     """
-                    CREATE INDEX IF NOT EXISTS idx_hash ON articles(hash)
+                    CREATE TABLE IF NOT EXISTS http_validators (
+                        url TEXT PRIMARY KEY,
+                        etag TEXT,
+                        last_modified TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
                 """
                 )
+
+                # インデックス作成
+                # hashはUNIQUE制約の自動インデックスで検索できるため、
+                # 重複していたidx_hashは削除して書き込み時の更新コストを減らす
+                cursor.execute("DROP INDEX IF EXISTS idx_hash")
                 cursor.execute(
                     """
                     CREATE INDEX IF NOT EXISTS idx_site_created ON articles(site_name, created_at)
@@ -402,71 +702,58 @@ class ArticleDatabase:
             logger.error(f"データベース初期化エラー: {e}")
             raise
 
-    def is_article_exists(self, article: Article) -> bool:
-        """記事が既に存在するかチェック"""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT 1 FROM articles WHERE hash = ? LIMIT 1",
-                    (article.get_hash(),),
-                )
-                return cursor.fetchone() is not None
-        except sqlite3.Error as e:
-            logger.error(f"記事存在チェックエラー: {e}")
-            return False
-
-    def save_article(self, article: Article, site_name: str) -> bool:
-        """記事をデータベースに保存"""
+    def save_articles(self, articles: list[Article], site_name: str) -> int:
+        """複数の記事を一括保存（1トランザクション・executemany）"""
+        rows = [
+            (article.get_hash(), article.title, article.url, site_name)
+            for article in articles
+        ]
+        if not rows:
+            return 0
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(
+            with self.session() as conn:
+                # 書き込みロックを先に取得し、サイト単位で1回のコミットにまとめる
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.executemany(
                     """
                     INSERT OR IGNORE INTO articles (hash, title, url, site_name)
                     VALUES (?, ?, ?, ?)
                 """,
-                    (article.get_hash(), article.title, article.url, site_name),
+                    rows,
                 )
-                conn.commit()
-                return cursor.rowcount > 0
+                return cursor.rowcount
         except sqlite3.Error as e:
-            logger.error(f"記事保存エラー: {e}")
-            return False
+            logger.error(f"記事一括保存エラー: {e}")
+            return 0
 
-    def save_articles(self, articles: list[Article], site_name: str) -> int:
-        """複数の記事を一括保存"""
-        saved_count = 0
+    def filter_new_articles(self, articles: list[Article]) -> list[Article]:
+        """新しい記事のみをフィルタリング（IN句でまとめて既存チェック）"""
+        hashes = [article.get_hash() for article in articles]
+        existing: set[str] = set()
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                for article in articles:
-                    cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO articles (hash, title, url, site_name)
-                        VALUES (?, ?, ?, ?)
-                    """,
-                        (article.get_hash(), article.title, article.url, site_name),
+            with self.session() as conn:
+                for start in range(0, len(hashes), SQLITE_IN_CHUNK_SIZE):
+                    chunk = hashes[start : start + SQLITE_IN_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    existing.update(
+                        row[0]
+                        for row in conn.execute(
+                            f"SELECT hash FROM articles WHERE hash IN ({placeholders})",
+                            chunk,
+                        )
                     )
-                    if cursor.rowcount > 0:
-                        saved_count += 1
-                conn.commit()
         except sqlite3.Error as e:
-            logger.error(f"記事一括保存エラー: {e}")
-        return saved_count
-
-    def filter_new_articles(self, articles: list[Article]) -> list[Article]:
-        """新しい記事のみをフィルタリング"""
-        new_articles = []
-        for article in articles:
-            if not self.is_article_exists(article):
-                new_articles.append(article)
-        return new_articles
+            logger.error(f"記事存在チェックエラー: {e}")
+        return [
+            article
+            for article, article_hash in zip(articles, hashes)
+            if article_hash not in existing
+        ]
 
     def get_article_count(self, site_name: str | None = None) -> int:
         """記事数を取得"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 if site_name:
                     cursor.execute(
@@ -480,10 +767,123 @@ class ArticleDatabase:
             logger.error(f"記事数取得エラー: {e}")
             return 0
 
+    def get_article_counts_by_site(self) -> dict[str, int]:
+        """サイト別の記事数を1クエリで取得"""
+        try:
+            with self.session() as conn:
+                cursor = conn.execute(
+                    "SELECT site_name, COUNT(*) FROM articles GROUP BY site_name"
+                )
+                return dict(cursor.fetchall())
+        except sqlite3.Error as e:
+            logger.error(f"記事数取得エラー: {e}")
+            return {}
+
+    @staticmethod
+    def _translation_key(text: str) -> str:
+        """翻訳キャッシュのキー（原文のハッシュ値）"""
+        return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+    def get_translations(self, texts: list[str]) -> dict[str, str]:
+        """保存済みの翻訳結果をまとめて取得（原文 → 訳文、未保存の原文は含まない）"""
+        keys = {self._translation_key(text): text for text in texts}
+        hashes = list(keys)
+        found: dict[str, str] = {}
+        try:
+            with self.session() as conn:
+                for start in range(0, len(hashes), SQLITE_IN_CHUNK_SIZE):
+                    chunk = hashes[start : start + SQLITE_IN_CHUNK_SIZE]
+                    placeholders = ",".join("?" * len(chunk))
+                    for text_hash, translated in conn.execute(
+                        f"SELECT text_hash, translated FROM translations WHERE text_hash IN ({placeholders})",
+                        chunk,
+                    ):
+                        found[keys[text_hash]] = translated
+        except sqlite3.Error as e:
+            logger.error(f"翻訳キャッシュ取得エラー: {e}")
+        return found
+
+    def save_translations(self, translations: list[tuple[str, str]]) -> None:
+        """翻訳結果（原文, 訳文）をまとめて保存"""
+        rows = [
+            (self._translation_key(text), translated)
+            for text, translated in translations
+        ]
+        if not rows:
+            return
+        try:
+            with self.session() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO translations (text_hash, translated) VALUES (?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.error(f"翻訳キャッシュ保存エラー: {e}")
+
+    def get_http_validators(self, url: str) -> tuple[str | None, str | None]:
+        """URLに対して保存済みの(ETag, Last-Modified)を取得"""
+        try:
+            with self.session() as conn:
+                row = conn.execute(
+                    "SELECT etag, last_modified FROM http_validators WHERE url = ?",
+                    (url,),
+                ).fetchone()
+                return (row[0], row[1]) if row else (None, None)
+        except sqlite3.Error as e:
+            logger.error(f"HTTPキャッシュ情報取得エラー: {e}")
+            return None, None
+
+    def save_http_validators(
+        self, url: str, etag: str | None, last_modified: str | None
+    ) -> None:
+        """URLに対する(ETag, Last-Modified)を保存"""
+        try:
+            with self.session() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO http_validators (url, etag, last_modified)
+                    VALUES (?, ?, ?)
+                """,
+                    (url, etag, last_modified),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"HTTPキャッシュ情報保存エラー: {e}")
+
+    def get_data_version(self) -> int | None:
+        """他の接続（別プロセス）によるコミットを検知するためのバージョンを取得
+
+        取得できなかった場合はNoneを返す（呼び出し側はキャッシュミスとして扱う）
+        """
+        try:
+            with self.session() as conn:
+                return conn.execute("PRAGMA data_version").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error(f"データバージョン取得エラー: {e}")
+            return None
+
+    def get_dashboard_counts(self) -> tuple[int, int, int]:
+        """記事数・アクティブWebhook数・アクティブWebsite数を1クエリで取得"""
+        try:
+            with self.session() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT
+                        (SELECT COUNT(*) FROM articles),
+                        (SELECT COUNT(*) FROM webhooks WHERE is_active = 1),
+                        (SELECT COUNT(*) FROM websites WHERE is_active = 1)
+                """
+                )
+                article_count, webhook_count, website_count = cursor.fetchone()
+                return article_count, webhook_count, website_count
+        except sqlite3.Error as e:
+            logger.error(f"統計情報取得エラー: {e}")
+            return 0, 0, 0
+
     def cleanup_old_articles(self, days: int = 30) -> int:
         """古い記事を削除（デフォルト30日以上前）"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -504,35 +904,42 @@ class ArticleDatabase:
     # Webhook管理メソッド
     def add_webhook(self, webhook: Webhook) -> bool:
         """Webhookを追加"""
+        return self.add_webhook_raw(
+            webhook.name, webhook.endpoint, webhook.service_type, webhook.is_active
+        )
+
+    def add_webhook_raw(
+        self, name: str, endpoint: str, service_type: str, is_active: bool = True
+    ) -> bool:
+        """Webhookを各フィールドの値から直接追加"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
                     INSERT INTO webhooks (name, endpoint, service_type, is_active)
                     VALUES (?, ?, ?, ?)
                 """,
-                    (
-                        webhook.name,
-                        webhook.endpoint,
-                        webhook.service_type,
-                        webhook.is_active,
-                    ),
+                    (name, endpoint, service_type, is_active),
                 )
                 conn.commit()
-                logger.info(f"Webhook追加: {webhook.name} ({webhook.service_type})")
+                self._invalidate_active("webhooks")
+                logger.info(f"Webhook追加: {name} ({service_type})")
                 return True
         except sqlite3.IntegrityError:
-            logger.error(f"Webhook名が重複しています: {webhook.name}")
+            logger.error(f"Webhook名が重複しています: {name}")
             return False
         except sqlite3.Error as e:
             logger.error(f"Webhook追加エラー: {e}")
             return False
 
-    def get_active_webhooks(self) -> list[Webhook]:
-        """アクティブなWebhookを取得"""
+    def get_active_webhooks_raw(self) -> list[tuple]:
+        """アクティブなWebhookを行タプルのまま取得
+
+        列順: id, name, endpoint, service_type, is_active, created_at
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -542,28 +949,67 @@ class ArticleDatabase:
                     ORDER BY created_at
                 """
                 )
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Webhook取得エラー: {e}")
+            return []
 
-                webhooks = []
-                for row in cursor.fetchall():
-                    webhook = Webhook(
-                        id=row[0],
-                        name=row[1],
-                        endpoint=row[2],
-                        service_type=row[3],
-                        is_active=bool(row[4]),
-                        created_at=row[5],
-                    )
-                    webhooks.append(webhook)
+    def get_active_webhooks(self) -> list[Webhook]:
+        """アクティブなWebhookを取得（短時間キャッシュ）"""
+        return self._get_cached_active("webhooks", self._load_active_webhooks)
+
+    def _load_active_webhooks(self) -> list[Webhook]:
+        """アクティブなWebhookをDBから読み込む"""
+        # DBから読み込んだ値は検証済みのためバリデーションを省略
+        return [
+            Webhook.model_construct(
+                id=row[0],
+                name=row[1],
+                endpoint=row[2],
+                service_type=row[3],
+                is_active=bool(row[4]),
+                created_at=row[5],
+            )
+            for row in self.get_active_webhooks_raw()
+        ]
+
+    def get_webhook_by_id(
+        self, webhook_id: int, include_inactive: bool = False
+    ) -> Webhook | None:
+        """IDを指定してWebhookを取得（include_inactive=Trueなら非アクティブも対象）"""
+        try:
+            with self.session() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT id, name, endpoint, service_type, is_active, created_at
+                    FROM webhooks
+                    WHERE id = ? AND (is_active = 1 OR ?)
+                    LIMIT 1
+                """,
+                    (webhook_id, include_inactive),
+                )
 
-                return webhooks
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+
+                return Webhook.model_construct(
+                    id=row[0],
+                    name=row[1],
+                    endpoint=row[2],
+                    service_type=row[3],
+                    is_active=bool(row[4]),
+                    created_at=row[5],
+                )
         except sqlite3.Error as e:
             logger.error(f"Webhook取得エラー: {e}")
-            return []
+            return None
 
     def update_webhook_status(self, webhook_id: int, is_active: bool) -> bool:
         """Webhookのアクティブ状態を更新"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -572,6 +1018,7 @@ class ArticleDatabase:
                     (is_active, webhook_id),
                 )
                 conn.commit()
+                self._invalidate_active("webhooks")
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             logger.error(f"Webhook状態更新エラー: {e}")
@@ -580,10 +1027,11 @@ class ArticleDatabase:
     def delete_webhook(self, webhook_id: int) -> bool:
         """Webhookを削除"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM webhooks WHERE id = ?", (webhook_id,))
                 conn.commit()
+                self._invalidate_active("webhooks")
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             logger.error(f"Webhook削除エラー: {e}")
@@ -592,8 +1040,31 @@ class ArticleDatabase:
     # Website管理メソッド
     def add_website(self, website: Website) -> bool:
         """Websiteを追加"""
+        return self.add_website_raw(
+            website.name,
+            website.type,
+            website.url,
+            website.avatar,
+            website.selector,
+            website.is_active,
+            website.needs_translation,
+            website.target_webhook_ids,
+        )
+
+    def add_website_raw(
+        self,
+        name: str,
+        type: str,
+        url: str,
+        avatar: str | None = None,
+        selector: str | None = None,
+        is_active: bool = True,
+        needs_translation: bool = False,
+        target_webhook_ids: str | None = None,
+    ) -> bool:
+        """Websiteを各フィールドの値から直接追加"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -601,30 +1072,35 @@ class ArticleDatabase:
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                     (
-                        website.name,
-                        website.type,
-                        website.url,
-                        website.avatar,
-                        website.selector,
-                        website.is_active,
-                        website.needs_translation,
-                        website.target_webhook_ids,
+                        name,
+                        type,
+                        url,
+                        avatar,
+                        selector,
+                        is_active,
+                        needs_translation,
+                        target_webhook_ids,
                     ),
                 )
                 conn.commit()
-                logger.info(f"Website追加: {website.name} ({website.type})")
+                self._invalidate_active("websites")
+                logger.info(f"Website追加: {name} ({type})")
                 return True
         except sqlite3.IntegrityError:
-            logger.error(f"Website名が重複しています: {website.name}")
+            logger.error(f"Website名が重複しています: {name}")
             return False
         except sqlite3.Error as e:
             logger.error(f"Website追加エラー: {e}")
             return False
 
-    def get_active_websites(self) -> list[Website]:
-        """アクティブなWebsiteを取得"""
+    def get_active_websites_raw(self) -> list[tuple]:
+        """アクティブなWebsiteを行タプルのまま取得
+
+        列順: id, name, type, url, avatar, selector, is_active,
+        needs_translation, target_webhook_ids, created_at
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -634,32 +1110,75 @@ class ArticleDatabase:
                     ORDER BY created_at
                 """
                 )
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Website取得エラー: {e}")
+            return []
 
-                websites = []
-                for row in cursor.fetchall():
-                    website = Website(
-                        id=row[0],
-                        name=row[1],
-                        type=row[2],
-                        url=row[3],
-                        avatar=row[4],
-                        selector=row[5],
-                        is_active=bool(row[6]),
-                        needs_translation=bool(row[7]),
-                        target_webhook_ids=row[8],
-                        created_at=row[9],
-                    )
-                    websites.append(website)
+    def get_active_websites(self) -> list[Website]:
+        """アクティブなWebsiteを取得（短時間キャッシュ）"""
+        return self._get_cached_active("websites", self._load_active_websites)
+
+    def _load_active_websites(self) -> list[Website]:
+        """アクティブなWebsiteをDBから読み込む"""
+        # DBから読み込んだ値は検証済みのためバリデーションを省略
+        return [
+            Website.model_construct(
+                id=row[0],
+                name=row[1],
+                type=row[2],
+                url=row[3],
+                avatar=row[4],
+                selector=row[5],
+                is_active=bool(row[6]),
+                needs_translation=bool(row[7]),
+                target_webhook_ids=row[8],
+                created_at=row[9],
+            )
+            for row in self.get_active_websites_raw()
+        ]
 
-                return websites
+    def get_website_by_id(
+        self, website_id: int, include_inactive: bool = False
+    ) -> Website | None:
+        """IDを指定してWebsiteを取得（include_inactive=Trueなら非アクティブも対象）"""
+        try:
+            with self.session() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT id, name, type, url, avatar, selector, is_active, needs_translation, target_webhook_ids, created_at
+                    FROM websites
+                    WHERE id = ? AND (is_active = 1 OR ?)
+                    LIMIT 1
+                """,
+                    (website_id, include_inactive),
+                )
+
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+
+                return Website.model_construct(
+                    id=row[0],
+                    name=row[1],
+                    type=row[2],
+                    url=row[3],
+                    avatar=row[4],
+                    selector=row[5],
+                    is_active=bool(row[6]),
+                    needs_translation=bool(row[7]),
+                    target_webhook_ids=row[8],
+                    created_at=row[9],
+                )
         except sqlite3.Error as e:
             logger.error(f"Website取得エラー: {e}")
-            return []
+            return None
 
     def update_website_status(self, website_id: int, is_active: bool) -> bool:
         """Websiteのアクティブ状態を更新"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     """
@@ -668,6 +1187,7 @@ class ArticleDatabase:
                     (is_active, website_id),
                 )
                 conn.commit()
+                self._invalidate_active("websites")
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             logger.error(f"Website状態更新エラー: {e}")
@@ -676,39 +1196,100 @@ class ArticleDatabase:
     def delete_website(self, website_id: int) -> bool:
         """Websiteを削除"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.session() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM websites WHERE id = ?", (website_id,))
                 conn.commit()
+                self._invalidate_active("websites")
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             logger.error(f"Website削除エラー: {e}")
             return False
 
 
+def _parse_feed_links(content: bytes) -> list[tuple[str, str]]:
+    """フィードを解析して(タイトル, リンク)を取得（ワーカースレッドで実行）"""
+    # 通知処理でのみ使うため遅延インポート（APIプロセスの起動を軽くする）
+    import fastfeedparser
+
+    # タイトルとリンク以外は不要なため抽出を省略
+    feed = fastfeedparser.parse(
+        content,
+        include_content=False,
+        include_tags=False,
+        include_media=False,
+        include_enclosures=False,
+    )
+
+    links: list[tuple[str, str]] = []
+    for entry in feed.entries[:MAX_ARTICLES_PER_SITE]:
+        title = (entry.get("title") or "").strip()
+        link = entry.get("link")
+        if title and link:
+            links.append((title, link))
+    return links
+
+
+def _parse_anchor_links(
+    content: bytes, encoding: str, selector: str | None
+) -> list[tuple[str, str]]:
+    """HTMLからセレクタに一致するリンクの(タイトル, href)を取得（ワーカースレッドで実行）"""
+    if not selector:
+        return []
+
+    # 通知処理でのみ使うため遅延インポート（APIプロセスの起動を軽くする）
+    from selectolax.lexbor import LexborHTMLParser
+
+    # UTF-8ならバイト列のままLexborに渡し、Python側での全文デコードを省く
+    # それ以外の文字コードはレスポンスヘッダから決定したものでデコード
+    if codecs.lookup(encoding).name == "utf-8":
+        tree = LexborHTMLParser(content)
+    else:
+        tree = LexborHTMLParser(content.decode(encoding, errors="replace"))
+
+    links: list[tuple[str, str]] = []
+    for anchor in tree.css(selector)[:MAX_ARTICLES_PER_SITE]:
+        href = anchor.attributes.get("href")
+        if href:
+            title = anchor.text().strip()
+            if title:
+                links.append((title, href))
+    return links
+
+
 class RssSite(Website):
     """RSSフィードから記事を取得するサイト"""
 
-    def fetch_articles(self) -> list[Article]:
+    async def fetch_articles(self, session: aiohttp.ClientSession) -> list[Article]:
         """RSSフィードから記事を取得"""
         try:
             logger.info(f"RSSフィード取得開始: {self.name}")
-            feed = feedparser.parse(self.url)
-
-            if feed.bozo:
-                logger.warning(f"RSSフィードの解析に問題があります: {self.name}")
 
-            articles = []
-            for entry in feed.entries[:MAX_ARTICLES_PER_SITE]:
-                if hasattr(entry, "title") and hasattr(entry, "link"):
-                    title = entry.title.strip()
-                    link = self._validate_url(entry.link)
-                    if title and link:
-                        articles.append(Article(title=title, url=link))
+            headers = await self._conditional_get_headers()
+            async with session.get(self.url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info(f"RSSフィード更新なし: {self.name}")
+                    return []
+                response.raise_for_status()
+                content = await response.read()
+                feed_url = str(response.url)
+
+            # lxmlは解析中にGILを解放するため、スレッドで各サイトを並列に解析できる
+            links = await asyncio.to_thread(_parse_feed_links, content)
+            # 相対リンクはリダイレクト後のフィードのURLを基準に解決
+            articles = [
+                Article(title=title, url=urljoin(feed_url, link))
+                for title, link in links
+            ]
+            # 解析に成功した場合のみ検証子を記録（失敗した内容を304で取りこぼさないため）
+            self._remember_http_validators(response)
 
             logger.info(f"RSS記事取得完了: {self.name} ({len(articles)}件)")
             return articles
 
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"HTTP リクエストエラー [{self.name}]: {e}")
+            return []
         except Exception as e:
             logger.error(f"RSS記事取得エラー [{self.name}]: {e}")
             return []
@@ -717,34 +1298,40 @@ class RssSite(Website):
 class ScrapingSite(Website):
     """Webスクレイピングで記事を取得するサイト"""
 
-    def fetch_articles(self) -> list[Article]:
+    async def fetch_articles(self, session: aiohttp.ClientSession) -> list[Article]:
         """Webスクレイピングで記事を取得"""
         try:
             logger.info(f"スクレイピング開始: {self.name}")
 
             headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                **await self._conditional_get_headers(),
             }
 
-            response = requests.get(self.url, headers=headers, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            anchors = soup.select(self.selector or "")
+            async with session.get(self.url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info(f"ページ更新なし: {self.name}")
+                    return []
+                response.raise_for_status()
+                content = await response.read()
+                encoding = response.get_encoding()
+                page_url = str(response.url)
 
-            articles: list[Article] = []
-            for anchor in anchors[:MAX_ARTICLES_PER_SITE]:
-                href = anchor.get("href")
-                if href:
-                    title = anchor.get_text(strip=True)
-                    if title:
-                        url = self._validate_url(href)
-                        articles.append(Article(title=title, url=url))
+            links = await asyncio.to_thread(
+                _parse_anchor_links, content, encoding, self.selector
+            )
+            # 相対リンクはブラウザと同様にページのURLを基準に解決
+            articles = [
+                Article(title=title, url=urljoin(page_url, href))
+                for title, href in links
+            ]
+            # 解析に成功した場合のみ検証子を記録（失敗した内容を304で取りこぼさないため）
+            self._remember_http_validators(response)
 
             logger.info(f"スクレイピング完了: {self.name} ({len(articles)}件)")
             return articles
 
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"HTTP リクエストエラー [{self.name}]: {e}")
             return []
         except Exception as e:
@@ -758,34 +1345,16 @@ db = ArticleDatabase()
 
 def create_website_instance(website: Website) -> Website:
     """WebsiteデータからWebsiteインスタンスを作成"""
-    if website.type == "rss":
-        return RssSite(
-            id=website.id,
-            name=website.name,
-            type=website.type,
-            url=website.url,
-            avatar=website.avatar,
-            selector=website.selector,
-            is_active=website.is_active,
-            needs_translation=website.needs_translation,
-            target_webhook_ids=website.target_webhook_ids,
-            created_at=website.created_at,
-        )
-    elif website.type == "scraping":
-        return ScrapingSite(
-            id=website.id,
-            name=website.name,
-            type=website.type,
-            url=website.url,
-            avatar=website.avatar,
-            selector=website.selector,
-            is_active=website.is_active,
-            needs_translation=website.needs_translation,
-            target_webhook_ids=website.target_webhook_ids,
-            created_at=website.created_at,
-        )
-    else:
+    site_map: dict[str, type[Website]] = {
+        "rss": RssSite,
+        "scraping": ScrapingSite,
+    }
+
+    site_class = site_map.get(website.type)
+    if not site_class:
         raise ValueError(f"サポートされていないWebsiteタイプ: {website.type}")
+    # 値は検証済みのためバリデーションを省略してフィールドをそのまま引き継ぐ
+    return site_class.model_construct(**website.__dict__)
 
 
 def create_notification_service(webhook: Webhook) -> NotificationService:
@@ -803,13 +1372,16 @@ def create_notification_service(webhook: Webhook) -> NotificationService:
     return service_class(webhook)
 
 
-def _send_to_webhook(
-    webhook: Webhook, website: "Website", articles: list[Article]
+async def _send_to_webhook(
+    session: aiohttp.ClientSession,
+    webhook: Webhook,
+    website: "Website",
+    articles: list[Article],
 ) -> bool:
     """単一のWebhookに通知を送信"""
     try:
         service = create_notification_service(webhook)
-        return service.send_notification(website, articles)
+        return await service.send_notification(session, website, articles)
     except ValueError as e:
         logger.error(f"サービス作成エラー [{webhook.name}]: {e}")
         return False
@@ -820,25 +1392,25 @@ def _send_to_webhook(
 
 def _get_target_webhooks(webhooks: list[Webhook], website: "Website") -> list[Webhook]:
     """対象となるWebhookリストを取得"""
-    if not hasattr(website, "target_webhook_ids") or not website.target_webhook_ids:
+    target_ids = website.get_target_webhook_ids()
+    if target_ids is None:
         # target_webhook_ids が設定されていない場合、全てのWebhookが対象
         return webhooks
 
     # target_webhook_ids が設定されている場合、指定されたIDのWebhookのみ
-    target_ids = [
-        id.strip() for id in website.target_webhook_ids.split(",") if id.strip()
-    ]
-    return [webhook for webhook in webhooks if str(webhook.id) in target_ids]
+    return [webhook for webhook in webhooks if webhook.id in target_ids]
 
 
-def post_message(website: "Website", articles: list[Article]) -> bool:
+async def post_message(
+    session: aiohttp.ClientSession, website: "Website", articles: list[Article]
+) -> bool:
     """全てのアクティブなWebhookに記事を投稿"""
     if not articles:
         logger.info(f"投稿する記事がありません: {website.name}")
         return True
 
-    # アクティブなWebhookを取得
-    all_webhooks = db.get_active_webhooks()
+    # アクティブなWebhookを取得（他サイトの保存処理とロックを競合するためスレッドで実行）
+    all_webhooks = await asyncio.to_thread(db.get_active_webhooks)
     if not all_webhooks:
         logger.error("投稿先のWebhookが設定されていません")
         return False
@@ -850,14 +1422,20 @@ def post_message(website: "Website", articles: list[Article]) -> bool:
         return False
 
     # 各Webhookに並行して通知送信
-    success_count = 0
-    for webhook in target_webhooks:
-        if _send_to_webhook(webhook, website, articles):
-            success_count += 1
+    results = await asyncio.gather(
+        *(
+            _send_to_webhook(session, webhook, website, articles)
+            for webhook in target_webhooks
+        ),
+        return_exceptions=True,
+    )
+    success_count = sum(1 for result in results if result is True)
 
     # 投稿成功後、記事をデータベースに保存
     if success_count > 0:
-        saved_count = db.save_articles(articles, website.name)
+        saved_count = await asyncio.to_thread(
+            db.save_articles, articles, website.name
+        )
         logger.info(
             f"投稿完了: {website.name} ({success_count}/{len(target_webhooks)} Webhook成功, {saved_count}件DB保存)"
         )
@@ -888,19 +1466,31 @@ def get_news_website_list() -> list[Website]:
     return websites
 
 
-def process_site(site: "Website") -> bool:
+async def process_site(site: "Website", session: aiohttp.ClientSession) -> bool:
     """サイトの記事を処理してDiscordに投稿"""
+    success = await _process_site_articles(site, session)
+    # 投稿まで完了した場合のみ条件付きGET用の値を保存（失敗時は次回も再取得する）
+    if success:
+        await asyncio.to_thread(site.save_http_validators)
+    return success
+
+
+async def _process_site_articles(
+    site: "Website", session: aiohttp.ClientSession
+) -> bool:
+    """記事の取得・フィルタリング・翻訳・投稿を行う"""
     try:
         logger.info(f"サイト処理開始: {site.name}")
 
         # 記事を取得
-        all_articles = site.fetch_articles()
+        all_articles = await site.fetch_articles(session)
         if not all_articles:
             logger.info(f"取得記事なし: {site.name}")
             return True
 
         # 新しい記事のみをフィルタリング
-        new_articles = db.filter_new_articles(all_articles)
+        # SQLiteの処理は他サイトの通信を止めないよう別スレッドで実行
+        new_articles = await asyncio.to_thread(db.filter_new_articles, all_articles)
         if not new_articles:
             logger.info(
                 f"新着記事なし: {site.name} (取得: {len(all_articles)}件, 既存: {len(all_articles)}件)"
@@ -914,14 +1504,17 @@ def process_site(site: "Website") -> bool:
         # 翻訳が必要な場合はタイトルを翻訳
         if site.needs_translation:
             logger.info(f"記事タイトルを翻訳中: {site.name}")
-            translated_articles = []
-            for article in new_articles:
-                translated_article = article.translate_title()
-                translated_articles.append(translated_article)
-            new_articles = translated_articles
+            # タイトルをまとめて翻訳APIに送る
+            translated_titles = await translate_batch(
+                session, [article.title for article in new_articles]
+            )
+            new_articles = [
+                article.with_translated_title(title)
+                for article, title in zip(new_articles, translated_titles)
+            ]
 
         # 新しい記事のみを投稿
-        success = post_message(site, new_articles)
+        success = await post_message(session, site, new_articles)
         if success:
             logger.info(f"サイト処理完了: {site.name} ({len(new_articles)}件投稿)")
         else:
@@ -934,6 +1527,24 @@ def process_site(site: "Website") -> bool:
         return False
 
 
+def create_http_session() -> aiohttp.ClientSession:
+    """翻訳・取得・通知で共有するHTTPセッションを作成（接続はキープアライブで再利用）"""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_LIMIT,
+        limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(
+            total=REQUEST_TIMEOUT,
+            sock_connect=HTTP_CONNECT_TIMEOUT,
+            sock_read=HTTP_READ_TIMEOUT,
+        ),
+    )
+
+
 def initialize_default_webhooks() -> None:
     """デフォルトのWebhookを初期化"""
     webhooks = db.get_active_webhooks()
@@ -943,7 +1554,7 @@ def initialize_default_webhooks() -> None:
         )
 
 
-def main() -> None:
+async def main() -> None:
     """メイン処理：全サイトの記事を並行処理で取得・投稿"""
     try:
         logger.info("ニュース収集処理開始")
@@ -952,8 +1563,7 @@ def main() -> None:
         initialize_default_webhooks()
 
         # データベース統計情報を出力
-        total_articles = db.get_article_count()
-        webhook_count = len(db.get_active_webhooks())
+        total_articles, webhook_count, _ = db.get_dashboard_counts()
         logger.info(
             f"データベース記事数: {total_articles}件, アクティブWebhook数: {webhook_count}件"
         )
@@ -967,33 +1577,28 @@ def main() -> None:
             logger.warning("処理対象のサイトがありません")
             return
 
-        threads = []
-        results = {}
+        # 各サイトを1つのHTTPセッションで並行処理（同時実行数は上限付き）
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SITES)
 
-        def thread_wrapper(site: "Website"):
-            """スレッド用のラッパー関数"""
-            results[site.name] = process_site(site)
+        async def process_site_limited(
+            site: Website, session: aiohttp.ClientSession
+        ) -> bool:
+            async with semaphore:
+                return await process_site(site, session)
 
-        # 各サイトを並行処理
-        for site in news_sites:
-            thread = threading.Thread(
-                target=thread_wrapper, args=(site,), name=f"Thread-{site.name}"
+        async with create_http_session() as session:
+            results = await asyncio.gather(
+                *(process_site_limited(site, session) for site in news_sites)
             )
-            thread.start()
-            threads.append(thread)
-
-        # 全スレッドの完了を待機
-        for thread in threads:
-            thread.join()
 
         # 結果の集計
-        successful = sum(1 for success in results.values() if success)
+        successful = sum(1 for success in results if success)
         total = len(results)
 
         # サイト別の記事数統計
+        site_counts = db.get_article_counts_by_site()
         for site in news_sites:
-            site_count = db.get_article_count(site.name)
-            logger.info(f"[{site.name}] 登録記事数: {site_count}件")
+            logger.info(f"[{site.name}] 登録記事数: {site_counts.get(site.name, 0)}件")
 
         logger.info(f"ニュース収集処理完了: {successful}/{total} サイト成功")
 
@@ -1001,27 +1606,45 @@ def main() -> None:
         logger.error(f"メイン処理でエラーが発生しました: {e}")
 
 
+def _next_run_time(after: datetime) -> datetime:
+    """afterより後の次回実行時刻（日本時間9:00）を計算"""
+    next_run = after.replace(
+        hour=SCHEDULE_HOUR, minute=SCHEDULE_MINUTE, second=0, microsecond=0
+    )
+    if next_run <= after:
+        next_run += timedelta(days=1)
+    return next_run
+
+
+async def _run_scheduler() -> None:
+    """毎日決まった時刻まで待機してニュース収集を実行し続ける"""
+    # SIGTERMで待機中・実行中のタスクをキャンセルして終了する
+    loop = asyncio.get_running_loop()
+    current_task = asyncio.current_task()
+    if current_task is not None:
+        try:
+            loop.add_signal_handler(signal.SIGTERM, current_task.cancel)
+        except NotImplementedError:  # Windowsのイベントループは非対応
+            pass
+
+    # 実行間隔（1日）はkeep-alive・DNSキャッシュの保持時間より長いため、
+    # HTTPセッションは使い回さずmain()で実行ごとに作成する
+    next_run = _next_run_time(datetime.now(SCHEDULE_TIMEZONE))
+    while True:
+        delay = (next_run - datetime.now(SCHEDULE_TIMEZONE)).total_seconds()
+        logger.info(f"次回実行: {next_run.isoformat()}（{max(delay, 0):.0f}秒後）")
+        await asyncio.sleep(max(delay, 0))
+        await main()
+        # 早めに起床しても同じ時刻で二重実行しないよう前回の予定時刻を基準にする
+        next_run = _next_run_time(max(datetime.now(SCHEDULE_TIMEZONE), next_run))
+
+
 def run_scheduler() -> None:
     """スケジューラーを実行"""
     try:
         logger.info("スケジューラー開始")
-        scheduler = BlockingScheduler()
-        # 日本時間（UTC+9）のタイムゾーン
-        jst = timezone(timedelta(hours=9))
-
-        scheduler.add_job(
-            main,
-            "cron",
-            hour=9,
-            minute=0,
-            timezone=jst,
-            id="news_collector",
-            max_instances=1,  # 同時実行を防ぐ
-            misfire_grace_time=300,
-            coalesce=False,
-        )
-        scheduler.start()
-    except KeyboardInterrupt:
+        asyncio.run(_run_scheduler())
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("スケジューラーが停止されました")
     except Exception as e:
         logger.error(f"スケジューラーエラー: {e}")
@@ -1031,7 +1654,7 @@ def run_once() -> None:
     """ニュース収集を1回だけ実行"""
     logger.info("ニュース収集を手動実行します")
     try:
-        main()
+        asyncio.run(main())
         logger.info("ニュース収集の手動実行が完了しました")
     except Exception as e:
         logger.error(f"手動実行エラー: {e}")
@@ -49,7 +49,7 @@ log_info "SSH connection successful"
 
 # アプリケーションファイルの転送
 log_info "Uploading application files..."
-rsync -avz --exclude='.git' --exclude='__pycache__' --exclude='.venv' --exclude='*.db' \
+rsync -avz --exclude='.git' --exclude='__pycache__' --exclude='.venv' --exclude='*.db' --exclude='*.db-wal' --exclude='*.db-shm' \
     ./ $SSH_USER@$SERVER_IP:$APP_DIR/
 
 # リモートでのセットアップ実行
@@ -51,17 +51,21 @@ def is_port_available(port: int) -> bool:
             return False
 
 
-def wait_for_server(url: str, timeout: int = 30) -> bool:
-    """サーバーが起動するまで待機"""
+def wait_for_server(port: int, host: str = "localhost", timeout: int = 30) -> bool:
+    """サーバーが起動するまで待機
+
+    uvicornはlifespanの起動処理が終わってからlistenするため、TCP接続できれば
+    リクエストを受け付けられる。HTTP往復の代わりに接続だけを指数バックオフで試す。
+    """
     start_time = time.time()
+    delay = 0.01
     while time.time() - start_time < timeout:
         try:
-            response = requests.get(url, timeout=1)
-            if response.status_code == 200:
+            with socket.create_connection((host, port), timeout=0.2):
                 return True
-        except requests.exceptions.RequestException:
-            pass
-        time.sleep(0.5)
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
     return False
 
 
@@ -87,7 +91,7 @@ def api_server():
     server_url = f"http://localhost:{port}"
 
     # サーバーが起動するまで待機
-    if wait_for_server(f"{server_url}/health", timeout=30):
+    if wait_for_server(port, timeout=30):
         print(f"API server started at {server_url}")
         yield server_url
     else:
@@ -220,6 +224,19 @@ class TestWebhookAPI:
             for field in required_fields:
                 assert field in webhook
 
+    def test_get_webhooks_not_modified(self, api_client):
+        """ETagによる304応答のテスト"""
+        response = api_client.get("/webhooks")
+        assert response.status_code == 200
+        etag = response.headers.get("ETag")
+        assert etag
+
+        response = api_client.session.get(
+            f"{api_client.base_url}/webhooks", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
     def test_get_webhook_by_id(self, api_client):
         """個別Webhook取得のテスト"""
         # まず全Webhookを取得してIDを確認
@@ -324,6 +341,38 @@ class TestWebhookAPI:
             data = response.json()
             assert data["success"] is True
 
+    def test_reactivate_webhook(self, api_client):
+        """Webhookの無効化・再有効化のテスト"""
+        unique_id = str(uuid.uuid4())[:8]
+        webhook_name = f"Test Teams Webhook {unique_id}"
+        webhook_data = {
+            "name": webhook_name,
+            "endpoint": f"https://outlook.office.com/webhook/test{unique_id}",
+            "service_type": "teams"
+        }
+
+        response = api_client.post("/webhooks", webhook_data)
+        assert response.status_code == 200
+
+        webhooks = api_client.get("/webhooks").json()
+        webhook_id = next(w["id"] for w in webhooks if w["name"] == webhook_name)
+        self.created_webhooks.append(webhook_id)
+
+        # 無効化後はIDで取得できないこと
+        response = api_client.put(f"/webhooks/{webhook_id}", {"is_active": False})
+        assert response.status_code == 200
+
+        response = api_client.get(f"/webhooks/{webhook_id}")
+        assert response.status_code == 404
+
+        # 再有効化できること
+        response = api_client.put(f"/webhooks/{webhook_id}", {"is_active": True})
+        assert response.status_code == 200
+
+        response = api_client.get(f"/webhooks/{webhook_id}")
+        assert response.status_code == 200
+        assert response.json()["is_active"] is True
+
 
 class TestWebsiteAPI:
     """Website API のテスト"""
@@ -591,6 +640,45 @@ class TestDataConsistency:
         assert crud_site_after_delete is None
 
 
+class TestResponseCache:
+    """レスポンスキャッシュのテスト（サーバーを介さずプロセス内で実行）"""
+
+    @pytest.fixture
+    def isolated_api(self, tmp_path, monkeypatch):
+        """一時DBと空のキャッシュを使うようにapiモジュールを差し替える"""
+        import api
+        from app import ArticleDatabase, VersionedCache
+
+        test_db = ArticleDatabase(str(tmp_path / "cache_test.db"))
+        monkeypatch.setattr(api, "db", test_db)
+        monkeypatch.setattr(
+            api, "_response_cache",
+            VersionedCache(api.CACHE_TTL_SECONDS, test_db.get_data_version)
+        )
+        return api
+
+    def test_fill_interleaved_with_update(self, isolated_api, monkeypatch):
+        """一覧の作成中に更新が入っても、更新前の一覧がキャッシュに残らないこと"""
+        api = isolated_api
+        assert api.db.add_webhook_raw("Cache Test Webhook", "https://example.com/cache", "discord")
+        webhook_id = api.db.get_active_webhooks_raw()[0][0]
+
+        read_rows = api.db.get_active_webhooks_raw
+
+        def read_then_update():
+            # 一覧を読み込んだ直後にPUTが完了した状況を再現
+            rows = read_rows()
+            api.update_webhook(webhook_id, api.WebhookUpdate(is_active=False))
+            return rows
+
+        monkeypatch.setattr(api.db, "get_active_webhooks_raw", read_then_update)
+        stale = json.loads(api._get_cached("webhooks").payload)
+        assert [w["id"] for w in stale] == [webhook_id]
+
+        monkeypatch.setattr(api.db, "get_active_webhooks_raw", read_rows)
+        assert json.loads(api._get_cached("webhooks").payload) == []
+
+
 if __name__ == "__main__":
     # テストの実行
     pytest.main([
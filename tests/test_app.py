@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+News Notify App - ニュース収集処理の単体テスト
+一時DBと差し替えたHTTPレスポンスで app.py の各処理を検証
+"""
+
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import app
+from app import ArticleDatabase
+
+
+@pytest.fixture
+def test_db(tmp_path, monkeypatch):
+    """一時ファイルのDBをグローバルのdbとして使う"""
+    database = ArticleDatabase(str(tmp_path / "app_test.db"))
+    monkeypatch.setattr(app, "db", database)
+    return database
+
+
+class TestActiveCache:
+    """アクティブなWebhook一覧キャッシュのテスト"""
+
+    def test_fill_interleaved_with_update(self, test_db, monkeypatch):
+        """一覧の読み込み中に更新が入っても、更新前の一覧がキャッシュに残らないこと"""
+        assert test_db.add_webhook_raw("Cache Webhook", "https://example.com/c", "discord")
+        webhook_id = test_db.get_active_webhooks_raw()[0][0]
+
+        load = test_db._load_active_webhooks
+
+        def load_then_update():
+            # 一覧を読み込んだ直後に無効化が完了した状況を再現
+            webhooks = load()
+            test_db.update_webhook_status(webhook_id, False)
+            return webhooks
+
+        monkeypatch.setattr(test_db, "_load_active_webhooks", load_then_update)
+        assert [w.id for w in test_db.get_active_webhooks()] == [webhook_id]
+
+        monkeypatch.setattr(test_db, "_load_active_webhooks", load)
+        assert test_db.get_active_webhooks() == []
+
+    def test_cached_until_invalidated(self, test_db, monkeypatch):
+        """無効化されるまではDBを読み直さないこと"""
+        assert test_db.add_webhook_raw("Cache Webhook", "https://example.com/c", "discord")
+        calls = []
+        load = test_db._load_active_webhooks
+
+        def counting_load():
+            calls.append(1)
+            return load()
+
+        monkeypatch.setattr(test_db, "_load_active_webhooks", counting_load)
+        test_db.get_active_webhooks()
+        test_db.get_active_webhooks()
+        assert len(calls) == 1
+
+        assert test_db.add_webhook_raw("Second Webhook", "https://example.com/d", "slack")
+        assert len(test_db.get_active_webhooks()) == 2
+        assert len(calls) == 2
+
+
+@pytest.fixture
+def translation_api(test_db, monkeypatch):
+    """MyMemory APIの応答を差し替え、受け取ったクエリを記録する"""
+    monkeypatch.setattr(app, "_translation_cache", OrderedDict())
+    queries: list[str] = []
+    state = {"split": True, "fail": False}
+
+    async def fake_request_translation(session, query):
+        queries.append(query)
+        if state["fail"]:
+            return None
+        parts = query.split(app.TRANSLATION_BATCH_DELIMITER)
+        if not state["split"]:
+            # 区切りが失われた応答（分割数が入力と一致しない）
+            return " ".join(f"訳:{part}" for part in parts)
+        # 実際のAPIと同様に区切りの前後の改行は崩れることがある
+        return " --- ".join(f"訳:{part}" for part in parts)
+
+    monkeypatch.setattr(app, "_request_translation", fake_request_translation)
+    return queries, state
+
+
+class TestTranslateBatch:
+    """タイトル一括翻訳のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_joins_titles_into_one_request(self, translation_api):
+        """複数タイトルを区切り文字で連結して1回で翻訳し、入力順に戻すこと"""
+        queries, _ = translation_api
+        result = await app.translate_batch(None, ["Alpha", "Beta", "Gamma"])
+
+        assert result == ["訳:Alpha", "訳:Beta", "訳:Gamma"]
+        assert queries == [app.TRANSLATION_BATCH_DELIMITER.join(["Alpha", "Beta", "Gamma"])]
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_and_maps_positions(self, translation_api):
+        """同じタイトルは1回だけ問い合わせ、全ての位置に結果を反映すること"""
+        queries, _ = translation_api
+        texts = ["Alpha", "日本語のタイトル", " Alpha ", "", "Beta", "Alpha"]
+        result = await app.translate_batch(None, texts)
+
+        assert result == ["訳:Alpha", "日本語のタイトル", "訳:Alpha", "", "訳:Beta", "訳:Alpha"]
+        assert queries == [app.TRANSLATION_BATCH_DELIMITER.join(["Alpha", "Beta"])]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_per_title_when_split_count_differs(self, translation_api):
+        """分割数が入力と一致しない場合はタイトルごとに翻訳し直すこと"""
+        queries, state = translation_api
+        state["split"] = False
+        result = await app.translate_batch(None, ["Alpha", "Beta"])
+
+        assert result == ["訳:Alpha", "訳:Beta"]
+        assert queries[0] == app.TRANSLATION_BATCH_DELIMITER.join(["Alpha", "Beta"])
+        assert sorted(queries[1:]) == ["Alpha", "Beta"]
+
+    @pytest.mark.asyncio
+    async def test_splits_requests_by_query_length(self, translation_api, monkeypatch):
+        """クエリ長の上限を超える場合は複数のリクエストに分けること"""
+        queries, _ = translation_api
+        monkeypatch.setattr(app, "TRANSLATION_MAX_QUERY_LENGTH", 25)
+        texts = ["Title one", "Title two", "Title three"]
+        result = await app.translate_batch(None, texts)
+
+        assert result == [f"訳:{text}" for text in texts]
+        assert len(queries) == 2
+        assert all(len(query) <= 25 for query in queries)
+
+    @pytest.mark.asyncio
+    async def test_uses_memory_then_database_cache(self, translation_api, test_db):
+        """翻訳済みのタイトルはメモリ、次にDBから取得してAPIを呼ばないこと"""
+        queries, _ = translation_api
+        await app.translate_batch(None, ["Alpha", "Beta"])
+        assert len(queries) == 1
+
+        # メモリキャッシュから取得
+        assert await app.translate_batch(None, ["Beta", "Alpha"]) == ["訳:Beta", "訳:Alpha"]
+        assert len(queries) == 1
+
+        # メモリを消してもDBから取得し、メモリにも戻す
+        app._translation_cache.clear()
+        assert await app.translate_batch(None, ["Alpha", "Gamma"]) == ["訳:Alpha", "訳:Gamma"]
+        assert queries[1:] == ["Gamma"]
+        assert "Alpha" in app._translation_cache
+        assert test_db.get_translations(["Alpha", "Beta", "Gamma"]) == {
+            "Alpha": "訳:Alpha", "Beta": "訳:Beta", "Gamma": "訳:Gamma"
+        }
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_evicts_least_recently_used(self, translation_api, monkeypatch):
+        """メモリキャッシュは上限を超えると最も古く使われた結果から破棄すること"""
+        monkeypatch.setattr(app, "TRANSLATION_CACHE_SIZE", 2)
+        await app.translate_batch(None, ["Alpha"])
+        await app.translate_batch(None, ["Beta"])
+        await app.translate_batch(None, ["Alpha"])  # Alphaを最近使用に更新
+        await app.translate_batch(None, ["Gamma"])
+
+        assert list(app._translation_cache) == ["Alpha", "Gamma"]
+
+    @pytest.mark.asyncio
+    async def test_returns_original_when_api_fails(self, translation_api, test_db):
+        """翻訳APIが失敗した場合は原文を返し、結果を保存しないこと"""
+        _, state = translation_api
+        state["fail"] = True
+        assert await app.translate_batch(None, ["Alpha", "Beta"]) == ["Alpha", "Beta"]
+        assert test_db.get_translations(["Alpha", "Beta"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_parses_mymemory_response(self, test_db, monkeypatch):
+        """MyMemory APIのJSON応答から訳文を取り出して分割すること"""
+        monkeypatch.setattr(app, "_translation_cache", OrderedDict())
+
+        class FakeResponse:
+            def __init__(self, query):
+                self.query = query
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+            def raise_for_status(self):
+                pass
+
+            async def json(self, content_type=None):
+                translated = self.query.replace("Alpha", "アルファ").replace("Beta", "ベータ")
+                return {"responseStatus": 200, "responseData": {"translatedText": translated}}
+
+        class FakeSession:
+            def __init__(self):
+                self.params = []
+
+            def get(self, url, params):
+                assert url == app.TRANSLATION_API_URL
+                self.params.append(params)
+                return FakeResponse(params["q"])
+
+        session = FakeSession()
+        assert await app.translate_batch(session, ["Alpha", "Beta"]) == ["アルファ", "ベータ"]
+        assert len(session.params) == 1
+        assert session.params[0]["langpair"] == "en|ja"
+
+
+RSS_BODY = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item><title>Validator Test Article</title><link>https://example.com/articles/1</link></item>
+</channel></rss>"""
+
+
+class FeedServer:
+    """ETagに対応したRSSフィードと通知先Webhookを提供するテスト用サーバー"""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.hook_status = 204
+        self.if_none_match: list[str | None] = []
+        self.notifications: list[bytes] = []
+
+    async def feed(self, request: web.Request) -> web.Response:
+        if_none_match = request.headers.get("If-None-Match")
+        self.if_none_match.append(if_none_match)
+        if if_none_match == self.etag:
+            return web.Response(status=304)
+        return web.Response(
+            body=RSS_BODY, content_type="application/rss+xml", headers={"ETag": self.etag}
+        )
+
+    async def hook(self, request: web.Request) -> web.Response:
+        self.notifications.append(await request.read())
+        return web.Response(status=self.hook_status)
+
+    @asynccontextmanager
+    async def run(self):
+        application = web.Application()
+        application.router.add_get("/feed.xml", self.feed)
+        application.router.add_post("/hook", self.hook)
+        async with TestServer(application) as server:
+            yield server
+
+
+@pytest.fixture
+def feed_site(test_db, monkeypatch):
+    """テスト用サーバーを参照するRSSサイトとWebhookを登録"""
+    monkeypatch.setattr(app, "NOTIFY_RETRY_BASE_DELAY", 0)
+    server = FeedServer()
+
+    def make_site(base_url: str) -> app.Website:
+        if not test_db.get_active_webhooks():
+            test_db.add_webhook_raw("Validator Hook", f"{base_url}/hook", "discord")
+        return app.create_website_instance(
+            app.Website(name="Validator Feed", type="rss", url=f"{base_url}/feed.xml")
+        )
+
+    return server, make_site
+
+
+class TestConditionalGet:
+    """ETag/Last-Modifiedによる条件付きGETのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_validators_saved_after_successful_run(self, feed_site, test_db):
+        """取得・解析・投稿に成功した後でETagが保存されること"""
+        server, make_site = feed_site
+        async with server.run() as http_server, app.create_http_session() as session:
+            site = make_site(str(http_server.make_url("")).rstrip("/"))
+            assert test_db.get_http_validators(site.url) == (None, None)
+
+            assert await app.process_site(site, session) is True
+
+        assert server.if_none_match == [None]
+        assert len(server.notifications) == 1
+        assert test_db.get_http_validators(site.url) == ('"v1"', None)
+
+    @pytest.mark.asyncio
+    async def test_not_modified_sends_no_notifications(self, feed_site, test_db):
+        """2回目は保存したETagを送り、304なら通知しないこと"""
+        server, make_site = feed_site
+        async with server.run() as http_server, app.create_http_session() as session:
+            base_url = str(http_server.make_url("")).rstrip("/")
+            assert await app.process_site(make_site(base_url), session) is True
+            assert await app.process_site(make_site(base_url), session) is True
+
+        assert server.if_none_match == [None, '"v1"']
+        assert len(server.notifications) == 1
+
+    @pytest.mark.asyncio
+    async def test_parse_failure_keeps_previous_validators(
+        self, feed_site, test_db, monkeypatch
+    ):
+        """解析に失敗した場合は以前のETagを上書きしないこと"""
+        server, make_site = feed_site
+        server.etag = '"v2"'
+
+        def broken_parser(content):
+            raise ValueError("broken feed")
+
+        monkeypatch.setattr(app, "_parse_feed_links", broken_parser)
+        async with server.run() as http_server, app.create_http_session() as session:
+            site = make_site(str(http_server.make_url("")).rstrip("/"))
+            test_db.save_http_validators(site.url, '"v1"', None)
+
+            await app.process_site(site, session)
+
+        assert server.if_none_match == ['"v1"']
+        assert server.notifications == []
+        assert test_db.get_http_validators(site.url) == ('"v1"', None)
+
+    @pytest.mark.asyncio
+    async def test_failed_notification_keeps_validators_unsaved(self, feed_site, test_db):
+        """通知に失敗した場合はETagを保存せず、次回も全体を取得すること"""
+        server, make_site = feed_site
+        server.hook_status = 500
+        async with server.run() as http_server, app.create_http_session() as session:
+            site = make_site(str(http_server.make_url("")).rstrip("/"))
+            assert await app.process_site(site, session) is False
+
+        assert len(server.notifications) == app.NOTIFY_MAX_RETRIES
+        assert test_db.get_http_validators(site.url) == (None, None)
+
+
+class TestTargetWebhookIds:
+    """配信先Webhook IDの解析のテスト"""
+
+    def test_parses_ids_and_skips_invalid_values(self):
+        """数値以外（上付き数字など）は例外にせず読み飛ばすこと"""
+        site = app.Website(
+            name="Target Test", type="rss", url="https://example.com/feed.xml",
+            target_webhook_ids="1, 2,abc,²,,-3,10"
+        )
+        assert site.get_target_webhook_ids() == frozenset({1, 2, 10})
+
+    def test_returns_none_when_not_set(self):
+        """未設定の場合はNoneを返すこと"""
+        site = app.Website(name="Target Test", type="rss", url="https://example.com/feed.xml")
+        assert site.get_target_webhook_ids() is None